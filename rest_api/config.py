@@ -3,3 +3,14 @@ import os
 # Get the absolute path to project.sqlite, assuming it's in the parent directory of rest_api/
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "..", "project.sqlite")
+
+# Read-only copy of project.sqlite that heavy read endpoints can be routed to, so that long reporting
+# queries never hold locks on the live database while pallets are being registered
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "..", "project-snapshot.sqlite")
+
+# Maximum age in seconds of the snapshot before it is refreshed from the live database, which is also
+# the upper bound on how stale data read from the snapshot can be
+SNAPSHOT_MAX_AGE = int(os.environ.get("SNAPSHOT_MAX_AGE", 60))
+
+# Whether read endpoints use the snapshot by default, can be overridden per request with ?snapshot=true/false
+READ_FROM_SNAPSHOT = os.environ.get("READ_FROM_SNAPSHOT", "false").lower() == "true"
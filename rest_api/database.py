@@ -1,15 +1,43 @@
 # database.py (Database Connection & Queries)
 # Handling all raw SQL queries and database connections
+import os
 import sqlite3
+import threading
+import time
 from bottle import response
-from .config import DB_PATH
+from .config import DB_PATH, SNAPSHOT_PATH, SNAPSHOT_MAX_AGE
 from urllib.parse import quote, unquote
 
-# Establishes and returns a database connection
-def _get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
+# Makes sure that only one request at a time refreshes the snapshot
+_snapshot_lock = threading.Lock()
+
+# Establishes and returns a database connection, to a read-only snapshot of the database if requested
+def _get_db_connection(snapshot=False):
+    if snapshot:
+        _refresh_snapshot()
+        conn = sqlite3.connect(f"file:{quote(SNAPSHOT_PATH)}?mode=ro", uri=True)
+    else:
+        conn = sqlite3.connect(DB_PATH)
     return conn, conn.cursor()
 
+# Copies the live database to the snapshot file if the snapshot is missing or older than SNAPSHOT_MAX_AGE seconds
+def _refresh_snapshot():
+    with _snapshot_lock:
+        if os.path.exists(SNAPSHOT_PATH) and time.time() - os.path.getmtime(SNAPSHOT_PATH) < SNAPSHOT_MAX_AGE:
+            return
+
+        # Use the online backup API to get a consistent copy without blocking writers for more than a moment,
+        # and write it to a temporary file first so that readers of the old snapshot are never disturbed
+        temporary_path = f"{SNAPSHOT_PATH}.tmp"
+        source = sqlite3.connect(DB_PATH)
+        target = sqlite3.connect(temporary_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        os.replace(temporary_path, SNAPSHOT_PATH)
+
 # Closes the database connection
 def _close_db_connection(cursor, conn):
     if cursor:
@@ -69,8 +97,8 @@ def add_customer(name, address):
         _close_db_connection(cursor, conn)
 
 # Returns all customers
-def get_customers():
-    conn, cursor = _get_db_connection()
+def get_customers(snapshot=False):
+    conn, cursor = _get_db_connection(snapshot)
 
     try:
         # Fetch name and address of all customers
@@ -113,8 +141,8 @@ def add_ingredient(name, unit):
         _close_db_connection(cursor, conn)
 
 # Returns all ingredients and their stock
-def get_ingredients():
-    conn, cursor = _get_db_connection()
+def get_ingredients(snapshot=False):
+    conn, cursor = _get_db_connection(snapshot)
 
     try:
         # For each ingredient, fetch the name, the sum of all inventory update changes and the unit
@@ -204,8 +232,8 @@ def add_cookie(name, ingredients):
     
 
 # Returns the name and number of unblocked pallets of a cookie
-def get_cookies():
-    conn, cursor = _get_db_connection()
+def get_cookies(snapshot=False):
+    conn, cursor = _get_db_connection(snapshot)
 
     try:
         # For each cookie, fetch the name and number of pallets that are not present in the subquery,
@@ -298,8 +326,8 @@ def add_pallet(cookie):
         _close_db_connection(cursor, conn)
 
 # Returns all pallets 
-def get_pallets(cookie, after, before):
-    conn, cursor = _get_db_connection()
+def get_pallets(cookie, after, before, snapshot=False):
+    conn, cursor = _get_db_connection(snapshot)
 
     # Create a base query which fetches the ID, cookie type and date of all pallets, and a 1 or 0 depending on if 
     # they appear in the subquery which contains the pallets of that cookie produced while the cookie was blocked
@@ -23,7 +23,8 @@ def setup_routes(app):
     # Returns the names and addresses of all customers
     @app.route('/customers', method="GET")
     def get_customers():
-        return services.get_customers()
+        snapshot = request.query.get("snapshot")
+        return services.get_customers(snapshot)
 
     # Adds a new ingredient
     @app.route('/ingredients', method="POST")
@@ -40,7 +41,8 @@ def setup_routes(app):
     # Returns the name and current stock of all ingredients
     @app.route('/ingredients', method="GET")
     def get_ingredients():
-        return services.get_ingredients()
+        snapshot = request.query.get("snapshot")
+        return services.get_ingredients(snapshot)
     
     # Adds the name and recipe of a new cookie
     @app.route('/cookies', method="POST")
@@ -51,7 +53,8 @@ def setup_routes(app):
     # Returns the name and number of unblocked pallets for each cookie type
     @app.route('/cookies', method="GET")
     def get_cookies():
-        return services.get_cookies()
+        snapshot = request.query.get("snapshot")
+        return services.get_cookies(snapshot)
 
     # Returns the recipe of a given cookie, or status code 404 if there is no such cookie
     @app.route('/cookies/<cookie_name>/recipe', method="GET")
@@ -70,7 +73,8 @@ def setup_routes(app):
         cookie = request.query.get("cookie")
         after = request.query.get("after")
         before = request.query.get("before")
-        return services.get_pallets(cookie, after, before)
+        snapshot = request.query.get("snapshot")
+        return services.get_pallets(cookie, after, before, snapshot)
     
     # Blocks all pallets of a given produced produced during a given interval time
     @app.route('/cookies/<cookie_name>/block', method="POST")
@@ -1,8 +1,15 @@
 # Services.py (Business logic, Consistent Layered Approach)
 # Handles logic before calling database functions
 from . import database
+from .config import READ_FROM_SNAPSHOT
 from bottle import response
 
+# Decides whether a read should go to the snapshot, using the configured default if the request doesn't say
+def _use_snapshot(snapshot):
+    if snapshot is None:
+        return READ_FROM_SNAPSHOT
+    return snapshot.lower() in ("true", "1", "yes")
+
 def reset_database():
     return database.reset_database()
 
@@ -15,8 +22,8 @@ def add_customer(customer):
         return "Missing fields"
     return database.add_customer(name, address)
 
-def get_customers():
-    return database.get_customers()
+def get_customers(snapshot):
+    return database.get_customers(_use_snapshot(snapshot))
 
 # Checks if name or unit are missing from the body before continuing
 def add_ingredient(ingredient):
@@ -27,8 +34,8 @@ def add_ingredient(ingredient):
         return "Missing fields"
     return database.add_ingredient(name, unit)
 
-def get_ingredients():
-    return database.get_ingredients()
+def get_ingredients(snapshot):
+    return database.get_ingredients(_use_snapshot(snapshot))
 
 # Checks if delivery time or quantity are missing from the body before continuing
 def update_ingredient(ingredient, delivery):
@@ -49,8 +56,8 @@ def add_cookie(cookie):
     ingredients = [(ingredient["ingredient"], ingredient["amount"]) for ingredient in recipe]
     return database.add_cookie(name, ingredients)
 
-def get_cookies():
-    return database.get_cookies()
+def get_cookies(snapshot):
+    return database.get_cookies(_use_snapshot(snapshot))
 
 def get_recipe(cookie_name):
     return database.get_recipe(cookie_name)
@@ -63,8 +70,8 @@ def add_pallet(pallet):
         return "Missing fields"
     return database.add_pallet(cookie)
 
-def get_pallets(cookie, after, before):
-    return database.get_pallets(cookie, after, before)
+def get_pallets(cookie, after, before, snapshot):
+    return database.get_pallets(cookie, after, before, _use_snapshot(snapshot))
 
 def block_pallets(cookie, after, before):
     return database.block_pallets(cookie, after, before)